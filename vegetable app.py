@@ -1,46 +1,363 @@
 
 import json
 import tkinter as tk
-from tkinter import messagebox, simpledialog, ttk
-from datetime import datetime
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json works everywhere
+    orjson = None
+from tkinter import font as tkfont, messagebox, simpledialog, ttk
+from collections import Counter
+from dataclasses import asdict, dataclass, fields
+from functools import lru_cache
+import bisect
+import hashlib
+import hmac
+import math
 import os
+import queue
+import struct
+import threading
+import time
+
+# SHA-256 digest of the admin password, compared in constant time on login
+ADMIN_PASSWORD_HASH = bytes.fromhex(
+    "240be518fabd2724ddb6f04eeb1da5967448d7e831c08c8fa822809f74c720a9"
+)
+
+@lru_cache(maxsize=512)
+def _parse_qty(quantity_str):
+    """Parse a legacy '2kg'/'500g' display string into kilograms
+
+    Real logs repeat a handful of quantities endlessly, so the cache turns
+    the string munging into a dict hit after the first occurrence.
+    """
+    quantity_str = quantity_str.lower()
+    try:
+        if quantity_str.endswith("kg"):
+            return float(quantity_str[:-2])
+        if quantity_str.endswith("g"):
+            return float(quantity_str[:-1]) / 1000
+    except ValueError:
+        pass
+    return 0.0
+
+@dataclass(slots=True)
+class Order:
+    """One finalized sale; slotted so field access is a fixed-offset load"""
+    name: str = ""
+    quantity: str = ""
+    quantity_kg: float = 0.0
+    amount: float = 0.0
+    profit: float = 0.0
+    date: str = ""
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build an Order from a JSON record, parsing legacy quantities"""
+        order = cls(**{key: data[key] for key in _ORDER_FIELDS if key in data})
+        if "quantity_kg" not in data and order.quantity:
+            # Orders written by older versions only have the display string
+            order.quantity_kg = _parse_qty(order.quantity)
+        return order
+
+_ORDER_FIELDS = tuple(field.name for field in fields(Order))
+
+_ts_cache = [0, ""]
+
+def _now_str():
+    """Current wall-clock time as 'YYYY-mm-dd HH:MM:SS', memoized per second"""
+    t = int(time.time())
+    if t != _ts_cache[0]:
+        _ts_cache[0] = t
+        _ts_cache[1] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t))
+    return _ts_cache[1]
 
 class VegetableMarket:
     def __init__(self):
         self.data_file = "vegetable_market_data.json"
+        self.orders_file = "vegetable_market_orders.jsonl"
+        self.catalog_bin = "vegetable_market_catalog.bin"
+        self._last_saved_hash = None
+        self._dirty = False
+        self._save_after_id = None
+        self._last_time_str = None
+        self._last_save_time = None
+        self._price_after_id = None
+        self._last_order_inputs = None
+        self._veg_cache = (None, None)
+        self._total_count = 0
+        self._total_revenue = 0.0
+        self._total_profit = 0.0
+        self._sales_counts = Counter()
+        self._stock_value = 0.0
+        self._panels = {}
+        self._tree_numeric = {}
+        self._fill_gen = {}
+        self._closing = False
+        self._save_error = None
+        self._save_q = queue.Queue()
+        threading.Thread(target=self._writer_loop, daemon=True).start()
         self.load_data()
         self.setup_gui()
         
     def load_data(self):
-        """Load data from JSON file or initialize empty data"""
-        try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, "r") as file:
-                    data = json.load(file)
+        """Load the catalog and the append-only orders log"""
+        legacy_orders = []
+        self.vegetables = self._load_catalog_bin()
+        if self.vegetables is None:
+            try:
+                if os.path.exists(self.data_file):
+                    with open(self.data_file, "rb") as file:
+                        raw = file.read()
+                    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
                     self.vegetables = data.get("vegetables", {})
-                    self.orders = data.get("orders", [])
-            else:
+                    legacy_orders = [Order.from_dict(d) for d in data.get("orders", [])]
+                else:
+                    self.vegetables = {}
+            except (FileNotFoundError, ValueError) as e:
+                print(f"Error loading data: {e}")
                 self.vegetables = {}
-                self.orders = []
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Error loading data: {e}")
-            self.vegetables = {}
-            self.orders = []
+
+        self._orders = None  # parsed lazily from the orders log
+        if legacy_orders:
+            # One-time migration: move the history out of the catalog file
+            # so ordinary saves stop rewriting it
+            self.orders = legacy_orders + self._read_orders_log()
+            for order in legacy_orders:
+                self._append_order(order)
+            self.save_data()
+        self._rebuild_name_caches()
+
+    def _load_catalog_bin(self):
+        """Read the binary catalog cache if it is at least as new as the JSON"""
+        try:
+            if not (os.path.exists(self.catalog_bin) and os.path.exists(self.data_file)):
+                return None
+            if os.path.getmtime(self.catalog_bin) < os.path.getmtime(self.data_file):
+                return None  # the JSON was edited out-of-band; it wins
+            with open(self.catalog_bin, "rb") as file:
+                raw = file.read()
+            vegetables = {}
+            offset = 0
+            while offset < len(raw):
+                (name_len,) = struct.unpack_from("<H", raw, offset)
+                offset += 2
+                name = raw[offset:offset + name_len].decode()
+                offset += name_len
+                price, cost, stock = struct.unpack_from("<ddd", raw, offset)
+                offset += 24
+                vegetables[name] = {"price": price, "stock": stock, "cost": cost}
+            return vegetables
+        except (OSError, struct.error, UnicodeDecodeError) as e:
+            print(f"Error loading catalog cache: {e}")
+            return None
+
+    def _pack_catalog(self):
+        """Pack the catalog records into the fixed-layout binary cache format"""
+        parts = []
+        for name, veg in self.vegetables.items():
+            encoded = name.encode()
+            parts.append(struct.pack("<H", len(encoded)) + encoded)
+            parts.append(struct.pack(
+                "<ddd", veg.get("price", 0.0), veg.get("cost", 0.0), veg.get("stock", 0.0)
+            ))
+        return b"".join(parts)
+
+    def _read_orders_log(self):
+        """Parse the append-only orders log into a list of Order records"""
+        orders = []
+        try:
+            if os.path.exists(self.orders_file):
+                loads = orjson.loads if orjson is not None else json.loads
+                with open(self.orders_file, "rb") as file:
+                    for line in file:
+                        line = line.strip()
+                        if line:
+                            orders.append(Order.from_dict(loads(line)))
+        except (OSError, ValueError) as e:
+            print(f"Error loading orders: {e}")
+        return orders
+
+    @property
+    def orders(self):
+        """Order history, read from the orders log the first time it is needed"""
+        if self._orders is None:
+            self._orders = self._read_orders_log()
+            self._recompute_totals()
+        return self._orders
+
+    @orders.setter
+    def orders(self, value):
+        self._orders = value
+        self._recompute_totals()
+
+    def _recompute_totals(self):
+        """Refresh the running aggregates after the order list is replaced"""
+        orders = self._orders or []
+        self._total_count = len(orders)
+        self._total_revenue = math.fsum(order.amount for order in orders)
+        self._total_profit = math.fsum(order.profit for order in orders)
+        self._sales_counts = Counter(order.name for order in orders)
+
+    def _rebuild_name_caches(self):
+        """Rebuild the sorted and capitalized name caches after a catalog change"""
+        self._display_names = sorted(self.vegetables)
+        self._cap_names = {name: name.capitalize() for name in self._display_names}
+        self._veg_label_cache = {}
+        self._label_to_name = {}
+        self._stock_value = math.fsum(
+            veg.get("price", 0) * veg.get("stock", 0) for veg in self.vegetables.values()
+        )
+
+    def _veg_label(self, name, data):
+        """Formatted order-form label for a vegetable, cached until it changes"""
+        label = self._veg_label_cache.get(name)
+        if label is None:
+            label = f"{self._cap_names[name]} (Rs.{data['price']:.2f}/kg - {data['stock']:.2f}kg available)"
+            self._veg_label_cache[name] = label
+            self._label_to_name[label] = name
+        return label
+
+    def _add_name(self, name):
+        """Insert one vegetable into the sorted-name caches"""
+        if name not in self._cap_names:
+            bisect.insort(self._display_names, name)
+            self._cap_names[name] = name.capitalize()
+        self._invalidate_veg_label(name)
+
+    def _remove_name(self, name):
+        """Drop one vegetable from the sorted-name caches"""
+        if name in self._cap_names:
+            self._display_names.remove(name)
+            del self._cap_names[name]
+        self._invalidate_veg_label(name)
+
+    def _invalidate_veg_label(self, name):
+        """Drop the cached label after a price or stock change"""
+        label = self._veg_label_cache.pop(name, None)
+        if label is not None:
+            self._label_to_name.pop(label, None)
 
     def save_data(self):
-        """Save current data to JSON file"""
+        """Save the catalog, skipping the write if nothing changed"""
         try:
-            data = {
-                "vegetables": self.vegetables,
-                "orders": self.orders
-            }
-            with open(self.data_file, "w") as file:
-                json.dump(data, file, indent=4)
+            data = {"vegetables": self.vegetables}
+            if orjson is not None:
+                payload = orjson.dumps(data)
+            else:
+                payload = json.dumps(data, indent=4).encode()
+            payload_hash = hash(payload)
+            if payload_hash == self._last_saved_hash:
+                return True
+            self._save_q.put(("catalog", (payload, self._pack_catalog())))
+            self._last_saved_hash = payload_hash
             return True
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save data: {e}")
             return False
 
+    def _append_order(self, order):
+        """Queue one finalized order for appending to the orders log"""
+        if orjson is not None:
+            line = orjson.dumps(order) + b"\n"  # serializes dataclasses natively
+        else:
+            line = (json.dumps(asdict(order)) + "\n").encode()
+        self._save_q.put(("order", line))
+
+    def _writer_loop(self):
+        """Drain queued writes and apply them to disk off the Tk thread"""
+        while True:
+            kind, payload = self._save_q.get()
+            try:
+                if kind == "order":
+                    with open(self.orders_file, "ab", buffering=1 << 20) as file:
+                        file.write(payload)
+                elif kind == "clear_orders":
+                    open(self.orders_file, "wb").close()
+                else:
+                    json_payload, bin_payload = payload
+                    tmp_file = self.data_file + ".tmp"
+                    with open(tmp_file, "wb", buffering=1 << 20) as file:
+                        file.write(json_payload)
+                    os.replace(tmp_file, self.data_file)
+                    # written second so the cache mtime stays >= the JSON's
+                    tmp_file = self.catalog_bin + ".tmp"
+                    with open(tmp_file, "wb") as file:
+                        file.write(bin_payload)
+                    os.replace(tmp_file, self.catalog_bin)
+                # event_generate is the one Tk call that is safe from a
+                # worker thread; it runs _on_save_done on the Tk thread.
+                # Never call it during shutdown: the Tk thread is blocked
+                # in _save_q.join() then, and a cross-thread Tcl call would
+                # wait on it forever before task_done() could release it
+                if not self._closing:
+                    try:
+                        self.root.event_generate("<<SaveDone>>", when="tail")
+                    except (AttributeError, RuntimeError, tk.TclError):
+                        pass  # before setup_gui or after teardown
+            except Exception as e:
+                # A failed disk write must reach the user, not stdout;
+                # hand the message to the Tk thread like <<SaveDone>>
+                self._save_error = f"{e}"
+                notified = False
+                if not self._closing:
+                    try:
+                        self.root.event_generate("<<SaveError>>", when="tail")
+                        notified = True
+                    except (AttributeError, RuntimeError, tk.TclError):
+                        pass  # before setup_gui or after teardown
+                if not notified:
+                    print(f"Error saving data: {e}")
+            finally:
+                self._save_q.task_done()
+
+    def _schedule_save(self):
+        """Mark data dirty and coalesce rapid mutations into one deferred save"""
+        self._dirty = True
+        if self._save_after_id is None:
+            self._save_after_id = self.root.after(500, self._flush_save)
+
+    def _flush_save(self):
+        """Write pending changes to disk"""
+        self._save_after_id = None
+        if self._dirty:
+            self._dirty = False
+            self.save_data()
+
+    def _on_save_done(self, event=None):
+        """Record that the writer thread landed the latest snapshot"""
+        self._last_save_time = time.time()
+
+    def _on_save_error(self, event=None):
+        """Report a failed disk write from the writer thread"""
+        error, self._save_error = self._save_error, None
+        if error:
+            messagebox.showerror("Error", f"Failed to save data: {error}")
+
+    def _on_close(self):
+        """Flush any pending save before the window goes away"""
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        if self._dirty:
+            self._dirty = False
+            self.save_data()
+        self._closing = True
+        self._poll_writer_done()
+
+    def _poll_writer_done(self):
+        """Destroy the window once the writer has drained its queue
+
+        Polling via after() keeps the Tk event loop alive while waiting, so
+        the writer can always finish; blocking in _save_q.join() inside the
+        close callback could deadlock against its cross-thread Tk calls.
+        """
+        if self._save_q.unfinished_tasks:
+            self.root.after(50, self._poll_writer_done)
+        else:
+            self.root.destroy()
+
     def setup_gui(self):
         """Initialize the main GUI"""
         self.root = tk.Tk()
@@ -48,7 +365,22 @@ class VegetableMarket:
         self.root.geometry("900x700")
         self.root.configure(bg='#f8f9fa')
         self.root.resizable(True, True)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.bind("<<SaveDone>>", self._on_save_done)
+        self.root.bind("<<SaveError>>", self._on_save_error)
         
+        # Shared widget styles (one record per color, reused by every button)
+        self._style = ttk.Style(self.root)
+        self._btn_styles = {}
+
+        # Shared fonts: Tk re-parses tuple font specs per widget, while a
+        # named Font object is a single shared handle
+        self._font_title = tkfont.Font(family='Arial', size=16, weight='bold')
+        self._font_heading = tkfont.Font(family='Arial', size=14, weight='bold')
+        self._font_label_bold = tkfont.Font(family='Arial', size=12, weight='bold')
+        self._font_label = tkfont.Font(family='Arial', size=12)
+        self._font_body = tkfont.Font(family='Arial', size=11)
+
         # Configure main grid
         self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
@@ -109,24 +441,36 @@ class VegetableMarket:
         
     def update_time(self):
         """Update the current time display"""
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.time_label.config(text=current_time)
-        self.root.after(1000, self.update_time)
-        
+        # Reconfigure the label only when the text actually changes, and not
+        # at all while the window is iconified or withdrawn
+        if self.root.state() not in ('iconic', 'withdrawn'):
+            current_time = _now_str()
+            if current_time != self._last_time_str:
+                self._last_time_str = current_time
+                self.time_label.config(text=current_time)
+        # align the next tick to the wall-clock second so it never double-fires
+        self.root.after(1000 - int(time.time() * 1000) % 1000, self.update_time)
+        
+    def _button_style(self, color):
+        """Return a shared ttk style name for a flat colored button"""
+        style_name = self._btn_styles.get(color)
+        if style_name is None:
+            style_name = f"Btn{color.lstrip('#')}.TButton"
+            self._style.configure(
+                style_name,
+                background=color, foreground='white',
+                font=("Arial", 10, "bold"),
+                relief='flat', padding=(15, 10)
+            )
+            self._style.map(style_name, background=[('active', color)])
+            self._btn_styles[color] = style_name
+        return style_name
+
     def create_navigation(self):
         """Create navigation buttons"""
         nav_frame = tk.Frame(self.main_frame, bg='#f8f9fa')
-        nav_frame.grid(row=0, column=0, sticky='ew', pady=(0, 10))
         nav_frame.grid_columnconfigure(7, weight=1)  # Make last column expandable
         
-        nav_style = {
-            'height': 2,
-            'font': ("Arial", 10, "bold"),
-            'relief': 'flat',
-            'cursor': 'hand2',
-            'padx': 15
-        }
-        
         # Navigation buttons
         buttons = [
             ("🏠 Home", self.show_main_menu, '#3498db'),
@@ -138,28 +482,49 @@ class VegetableMarket:
         ]
         
         for i, (text, command, color) in enumerate(buttons):
-            btn = tk.Button(
+            btn = ttk.Button(
                 nav_frame,
                 text=text,
                 command=command,
-                bg=color,
-                fg='white',
-                **nav_style
+                style=self._button_style(color),
+                cursor='hand2'
             )
             btn.grid(row=0, column=i, padx=5, sticky='w')
-            
+
+        # Map the bar only once it is fully populated, so the geometry
+        # solver runs one pass instead of one per button
+        nav_frame.grid(row=0, column=0, sticky='ew', pady=(0, 10))
+        self.nav_frame = nav_frame
+
     def clear_content(self):
-        """Clear the content area"""
+        """Hide cached panels and destroy any one-off content"""
+        panels = set(self._panels.values())
         for widget in self.main_frame.winfo_children():
-            if widget != self.main_frame.winfo_children()[0]:  # Keep navigation
+            if widget is self.nav_frame:
+                continue
+            if widget in panels:
+                widget.grid_remove()
+            else:
                 widget.destroy()
+
+    def _show_panel(self, name, builder):
+        """Show a cached panel, building it on first use"""
+        self.clear_content()
+        panel = self._panels.get(name)
+        if panel is None:
+            # the builder grids the panel itself, remembering its options
+            self._panels[name] = builder()
+        else:
+            panel.grid()
                 
     def show_main_menu(self):
         """Show the main menu"""
-        self.clear_content()
-        
+        self._show_panel("menu", self._build_main_menu)
+        self._refresh_quick_stats()
+
+    def _build_main_menu(self):
+        """Build the main menu panel (once)"""
         content_frame = tk.Frame(self.main_frame, bg='#f8f9fa')
-        content_frame.grid(row=1, column=0, sticky='nsew', pady=20)
         content_frame.grid_rowconfigure(0, weight=1)
         content_frame.grid_columnconfigure(0, weight=1)
         
@@ -175,7 +540,7 @@ class VegetableMarket:
         ).pack(pady=30)
         
         # Quick stats
-        self.show_quick_stats(welcome_frame)
+        self._build_quick_stats(welcome_frame)
         
         # Quick actions
         actions_frame = tk.Frame(welcome_frame, bg='white')
@@ -184,7 +549,7 @@ class VegetableMarket:
         tk.Label(
             actions_frame,
             text="Quick Actions:",
-            font=("Arial", 14, "bold"),
+            font=self._font_heading,
             bg='white', fg='#34495e'
         ).pack(pady=(0, 15))
         
@@ -200,28 +565,27 @@ class VegetableMarket:
                 text=text,
                 command=command,
                 bg=color, fg='white',
-                font=("Arial", 11),
+                font=self._font_body,
                 width=25, height=2,
                 relief='flat', cursor='hand2'
             ).pack(pady=5)
-            
-    def show_quick_stats(self, parent):
-        """Show quick statistics on main menu"""
+
+        content_frame.grid(row=1, column=0, sticky='nsew', pady=20)
+        return content_frame
+
+    def _build_quick_stats(self, parent):
+        """Build the quick statistics tiles on the main menu (once)"""
         stats_frame = tk.Frame(parent, bg='white')
         stats_frame.pack(pady=20)
         
-        # Calculate stats
-        total_vegetables = len(self.vegetables)
-        total_orders = len(self.orders)
-        total_revenue = sum(order.get("amount", 0) for order in self.orders)
-        
         stats = [
-            ("🥬 Total Vegetables", total_vegetables, '#27ae60'),
-            ("🛒 Total Orders", total_orders, '#3498db'),
-            ("💰 Total Revenue", f"Rs. {total_revenue:.2f}", '#e74c3c')
+            ("🥬 Total Vegetables", '#27ae60'),
+            ("🛒 Total Orders", '#3498db'),
+            ("💰 Total Revenue", '#e74c3c')
         ]
         
-        for i, (label, value, color) in enumerate(stats):
+        self._quick_stat_values = []
+        for i, (label, color) in enumerate(stats):
             stat_frame = tk.Frame(stats_frame, bg=color, width=150, height=80)
             stat_frame.grid(row=0, column=i, padx=10, pady=5)
             stat_frame.grid_propagate(False)
@@ -232,18 +596,34 @@ class VegetableMarket:
                 bg=color, fg='white'
             ).pack(pady=(10, 5))
             
-            tk.Label(
-                stat_frame, text=str(value),
-                font=("Arial", 14, "bold"),
+            value_label = tk.Label(
+                stat_frame, text="",
+                font=self._font_heading,
                 bg=color, fg='white'
-            ).pack()
+            )
+            value_label.pack()
+            self._quick_stat_values.append(value_label)
+
+    def _refresh_quick_stats(self):
+        """Update the quick statistics tiles from the running aggregates"""
+        # touching self.orders materializes the log and totals once
+        total_orders = len(self.orders)
+        values = (
+            str(len(self.vegetables)),
+            str(total_orders),
+            f"Rs. {self._total_revenue:.2f}"
+        )
+        for value_label, value in zip(self._quick_stat_values, values):
+            value_label.config(text=value)
 
     def show_vegetables(self):
         """Display available vegetables"""
-        self.clear_content()
-        
+        self._show_panel("vegetables", self._build_vegetables_panel)
+        self._refresh_vegetables_panel()
+
+    def _build_vegetables_panel(self):
+        """Build the vegetables table panel (once)"""
         content_frame = tk.Frame(self.main_frame, bg='#f8f9fa')
-        content_frame.grid(row=1, column=0, sticky='nsew')
         content_frame.grid_rowconfigure(1, weight=1)
         content_frame.grid_columnconfigure(0, weight=1)
         
@@ -251,7 +631,7 @@ class VegetableMarket:
         tk.Label(
             content_frame,
             text="📋 Available Vegetables",
-            font=("Arial", 16, "bold"),
+            font=self._font_title,
             bg='#f8f9fa', fg='#2c3e50'
         ).grid(row=0, column=0, pady=15)
         
@@ -279,41 +659,84 @@ class VegetableMarket:
         h_scrollbar = ttk.Scrollbar(table_frame, orient="horizontal", command=tree.xview)
         tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
         
-        # Grid layout
+        # Configure tags for styling
+        tree.tag_configure("available", foreground="green")
+        tree.tag_configure("unavailable", foreground="red")
+
         tree.grid(row=0, column=0, sticky='nsew')
         v_scrollbar.grid(row=0, column=1, sticky='ns')
         h_scrollbar.grid(row=1, column=0, sticky='ew')
-        
-        # Populate data
+
+        self._veg_tree = tree
+        content_frame.grid(row=1, column=0, sticky='nsew')
+        return content_frame
+
+    def _refresh_vegetables_panel(self):
+        """Refill the vegetables table from the catalog"""
+        tree = self._veg_tree
+        tree.delete(*tree.get_children())
         if self.vegetables:
-            for name, data in sorted(self.vegetables.items()):
+            fmt2 = "{:.2f}".format
+            rows = []
+            numeric = []
+            for name in self._display_names:
+                data = self.vegetables[name]
+                price = data.get('price', 0)
                 stock = data.get('stock', 0)
                 status = "In Stock" if stock > 0 else "Out of Stock"
                 status_tag = "available" if stock > 0 else "unavailable"
-                
-                item = tree.insert("", "end", values=(
-                    name.capitalize(),
-                    f"{data.get('price', 0):.2f}",
-                    f"{stock:.2f}",
+                rows.append(((
+                    self._cap_names[name],
+                    fmt2(price),
+                    fmt2(stock),
                     status
-                ), tags=(status_tag,))
+                ), (status_tag,)))
+                numeric.append({"Price (Rs/kg)": price, "Stock (kg)": stock})
+            self._fill_tree_chunked(tree, rows, numeric=numeric)
         else:
-            tree.insert("", "end", values=("No vegetables available", "", "", ""))
-        
-        # Configure tags for styling
-        tree.tag_configure("available", foreground="green")
-        tree.tag_configure("unavailable", foreground="red")
+            # goes through the chunked filler so it also invalidates any
+            # still-pending fill from a previous refresh
+            self._fill_tree_chunked(
+                tree, [(("No vegetables available", "", "", ""), ())]
+            )
         
+    def _fill_tree_chunked(self, tree, rows, chunk=200, numeric=None):
+        """Insert (values, tags) rows in chunks, yielding to the event loop
+
+        ``numeric`` is an optional parallel list of {column: float} dicts,
+        recorded per inserted row so sort_treeview can sort without
+        re-parsing the formatted cell strings.
+        """
+        shadow = self._tree_numeric.setdefault(tree, {})
+        shadow.clear()
+        # Cached panels survive a switch-away, so winfo_exists() alone
+        # cannot tell a stale fill from a live one; bump a per-tree
+        # generation and let superseded closures bail out
+        generation = self._fill_gen.get(tree, 0) + 1
+        self._fill_gen[tree] = generation
+        def insert(start):
+            if self._fill_gen.get(tree) != generation or not tree.winfo_exists():
+                return  # a newer fill started, or the tree was destroyed
+            for i, (values, tags) in enumerate(rows[start:start + chunk], start):
+                iid = tree.insert("", "end", values=values, tags=tags)
+                if numeric is not None:
+                    shadow[iid] = numeric[i]
+            if start + chunk < len(rows):
+                self.root.after(1, insert, start + chunk)
+        insert(0)
+
     def show_create_order(self):
         """Show order creation interface"""
-        self.clear_content()
-        
         if not self.vegetables:
+            self.clear_content()
             self.show_message("No vegetables available. Please contact admin.", "info")
             return
-            
+        self._show_panel("order", self._build_order_panel)
+        self._refresh_order_panel()
+
+    def _build_order_panel(self):
+        """Build the order form panel (once)"""
         content_frame = tk.Frame(self.main_frame, bg='#f8f9fa')
-        content_frame.grid(row=1, column=0, sticky='nsew')
         content_frame.grid_rowconfigure(0, weight=1)
         content_frame.grid_columnconfigure(0, weight=1)
         
@@ -324,7 +747,7 @@ class VegetableMarket:
         tk.Label(
             order_frame,
             text="🛒 Create New Order",
-            font=("Arial", 16, "bold"),
+            font=self._font_title,
             bg='white', fg='#2c3e50'
         ).pack(pady=20)
         
@@ -333,27 +756,25 @@ class VegetableMarket:
         form_frame.pack(pady=20)
         
         # Vegetable selection
-        tk.Label(form_frame, text="Select Vegetable:", font=("Arial", 12), bg='white').grid(row=0, column=0, sticky='w', pady=10)
+        tk.Label(form_frame, text="Select Vegetable:", font=self._font_label, bg='white').grid(row=0, column=0, sticky='w', pady=10)
         
         self.vegetable_var = tk.StringVar()
-        vegetable_combo = ttk.Combobox(
+        self._order_combo = ttk.Combobox(
             form_frame,
             textvariable=self.vegetable_var,
-            values=[f"{name.capitalize()} (Rs.{data['price']:.2f}/kg - {data['stock']:.2f}kg available)" 
-                   for name, data in self.vegetables.items() if data['stock'] > 0],
             state="readonly",
             width=50
         )
-        vegetable_combo.grid(row=0, column=1, padx=10, pady=10)
+        self._order_combo.grid(row=0, column=1, padx=10, pady=10)
         
         # Quantity input
-        tk.Label(form_frame, text="Quantity:", font=("Arial", 12), bg='white').grid(row=1, column=0, sticky='w', pady=10)
+        tk.Label(form_frame, text="Quantity:", font=self._font_label, bg='white').grid(row=1, column=0, sticky='w', pady=10)
         
         quantity_frame = tk.Frame(form_frame, bg='white')
         quantity_frame.grid(row=1, column=1, sticky='w', padx=10, pady=10)
         
         self.quantity_var = tk.StringVar()
-        quantity_entry = tk.Entry(quantity_frame, textvariable=self.quantity_var, width=15, font=("Arial", 11))
+        quantity_entry = tk.Entry(quantity_frame, textvariable=self.quantity_var, width=15, font=self._font_body)
         quantity_entry.pack(side="left", padx=(0, 5))
         
         self.unit_var = tk.StringVar(value="kg")
@@ -369,7 +790,7 @@ class VegetableMarket:
         # Price display
         self.price_label = tk.Label(
             form_frame, text="", 
-            font=("Arial", 14, "bold"), 
+            font=self._font_heading, 
             bg='white'
         )
         self.price_label.grid(row=2, column=0, columnspan=2, pady=20)
@@ -388,7 +809,7 @@ class VegetableMarket:
             text="Place Order",
             command=self.place_order,
             bg='#28a745', fg='white',
-            font=("Arial", 12, "bold"),
+            font=self._font_label_bold,
             width=15, height=2,
             relief='flat', cursor='hand2'
         ).pack(side="left", padx=10)
@@ -398,21 +819,51 @@ class VegetableMarket:
             text="Clear Form",
             command=self.clear_order_form,
             bg='#6c757d', fg='white',
-            font=("Arial", 12),
+            font=self._font_label,
             width=15, height=2,
             relief='flat', cursor='hand2'
         ).pack(side="left", padx=10)
-        
+
+        content_frame.grid(row=1, column=0, sticky='nsew')
+        return content_frame
+
+    def _refresh_order_panel(self):
+        """Refresh the selectable vegetables and reset the form"""
+        self._order_combo['values'] = [
+            self._veg_label(name, self.vegetables[name])
+            for name in self._display_names if self.vegetables[name]['stock'] > 0
+        ]
+        self.clear_order_form()
+
     def update_order_price(self, *args):
+        """Coalesce bursts of variable traces into one price recompute"""
+        if self._price_after_id is not None:
+            self.root.after_cancel(self._price_after_id)
+        self._price_after_id = self.root.after(50, self._do_update_order_price)
+
+    def _do_update_order_price(self):
         """Update price display in real-time"""
+        self._price_after_id = None
         try:
             selection = self.vegetable_var.get()
+            inputs = (selection, self.quantity_var.get(), self.unit_var.get())
+            if inputs == self._last_order_inputs:
+                return  # trace fired without the values actually changing
+            self._last_order_inputs = inputs
             if not selection or not self.quantity_var.get():
                 self.price_label.config(text="", fg="black")
                 return
                 
-            # Extract vegetable name from selection
-            veg_name = selection.split(" (")[0].lower()
+            # Map the selection back to its vegetable in O(1); fall back to
+            # splitting the label if the cache was invalidated underneath us
+            veg_name = self._label_to_name.get(selection)
+            if veg_name is None:
+                cached_selection, cached_name = self._veg_cache
+                if selection == cached_selection:
+                    veg_name = cached_name
+                else:
+                    veg_name = selection.split(" (")[0].lower()
+                    self._veg_cache = (selection, veg_name)
             
             if veg_name not in self.vegetables:
                 return
@@ -434,6 +885,7 @@ class VegetableMarket:
             
     def clear_order_form(self):
         """Clear the order form"""
+        self._last_order_inputs = None  # prices/stock may have changed
         self.vegetable_var.set("")
         self.quantity_var.set("")
         self.unit_var.set("kg")
@@ -447,7 +899,7 @@ class VegetableMarket:
                 self.show_message("Please select a vegetable", "error")
                 return
                 
-            veg_name = selection.split(" (")[0].lower()
+            veg_name = self._label_to_name.get(selection) or selection.split(" (")[0].lower()
             quantity = float(self.quantity_var.get())
             unit = self.unit_var.get()
             
@@ -458,40 +910,50 @@ class VegetableMarket:
             # Convert to kg
             quantity_kg = quantity / 1000 if unit == "g" else quantity
             
-            if quantity_kg > self.vegetables[veg_name]["stock"]:
+            veg = self.vegetables[veg_name]
+            if quantity_kg > veg["stock"]:
                 self.show_message("Insufficient stock available", "error")
                 return
             
             # Calculate total
-            total_amount = quantity_kg * self.vegetables[veg_name]["price"]
+            total_amount = quantity_kg * veg["price"]
 
-            cost_price = self.vegetables[veg_name].get("cost", 0)
-            profit = round((self.vegetables[veg_name]["price"] - cost_price) * quantity_kg, 2)
+            cost_price = veg.get("cost", 0)
+            profit = round((veg["price"] - cost_price) * quantity_kg, 2)
 
             
             # Update stock
-            self.vegetables[veg_name]["stock"] -= quantity_kg
+            veg["stock"] -= quantity_kg
+            self._invalidate_veg_label(veg_name)
             
             # Add to orders
-            order = {
-                "name": veg_name,
-                "quantity": f"{quantity}{unit}",
-                "amount": round(total_amount, 2),
-                "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "profit":profit,
-            }
+            order = Order(
+                name=veg_name,
+                quantity=f"{quantity}{unit}",
+                quantity_kg=quantity_kg,
+                amount=round(total_amount, 2),
+                date=_now_str(),
+                profit=profit,
+            )
             self.orders.append(order)
-            
-            # Save data
-            if self.save_data():
-                self.show_message(
-                    f"Order placed successfully!\n"
-                    f"Vegetable: {veg_name.capitalize()}\n"
-                    f"Quantity: {quantity}{unit}\n"
-                    f"Total Amount: Rs. {total_amount:.2f}",
-                    "success"
-                )
-                self.clear_order_form()
+            self._total_count += 1
+            self._total_revenue += order.amount
+            self._total_profit += order.profit
+            self._sales_counts[veg_name] += 1
+            self._stock_value -= veg["price"] * quantity_kg
+            self._append_order(order)
+
+            # The stock change still goes through the (deferred) catalog save
+            self._schedule_save()
+            self.show_message(
+                f"Order placed successfully!\n"
+                f"Vegetable: {veg_name.capitalize()}\n"
+                f"Quantity: {quantity}{unit}\n"
+                f"Total Amount: Rs. {total_amount:.2f}",
+                "success"
+            )
+            # also refreshes the combobox labels to show the new stock
+            self._refresh_order_panel()
             
         except ValueError:
             self.show_message("Please enter a valid quantity", "error")
@@ -500,10 +962,12 @@ class VegetableMarket:
 
     def show_order_history(self):
         """Display order history"""
-        self.clear_content()
-        
+        self._show_panel("history", self._build_history_panel)
+        self._refresh_history_panel()
+
+    def _build_history_panel(self):
+        """Build the order history panel (once)"""
         content_frame = tk.Frame(self.main_frame, bg='#f8f9fa')
-        content_frame.grid(row=1, column=0, sticky='nsew')
         content_frame.grid_rowconfigure(1, weight=1)
         content_frame.grid_columnconfigure(0, weight=1)
         
@@ -515,19 +979,17 @@ class VegetableMarket:
         tk.Label(
             title_frame,
             text="📊 Order History",
-            font=("Arial", 16, "bold"),
+            font=self._font_title,
             bg='#f8f9fa', fg='#2c3e50'
         ).grid(row=0, column=0, sticky='w')
         
-        # Summary
-        total_amount = sum(order.get("amount", 0) for order in self.orders)
-        summary_label = tk.Label(
+        self._history_summary = tk.Label(
             title_frame,
-            text=f"Total Orders: {len(self.orders)} | Total Revenue: Rs. {total_amount:.2f}",
-            font=("Arial", 12, "bold"),
+            text="",
+            font=self._font_label_bold,
             bg='#f8f9fa', fg='#27ae60'
         )
-        summary_label.grid(row=0, column=1, sticky='e')
+        self._history_summary.grid(row=0, column=1, sticky='e')
         
         # Table frame
         table_frame = tk.Frame(content_frame, bg='white', relief='raised', bd=1)
@@ -557,35 +1019,55 @@ class VegetableMarket:
         tree.grid(row=0, column=0, sticky='nsew')
         v_scrollbar.grid(row=0, column=1, sticky='ns')
         h_scrollbar.grid(row=1, column=0, sticky='ew')
-        
-        # Populate orders (latest first)
+
+        self._history_tree = tree
+        content_frame.grid(row=1, column=0, sticky='nsew')
+        return content_frame
+
+    def _refresh_history_panel(self):
+        """Refill the order history table and its summary line"""
+        total_amount = self._total_revenue if self.orders else 0.0
+        self._history_summary.config(
+            text=f"Total Orders: {self._total_count} | Total Revenue: Rs. {total_amount:.2f}"
+        )
+
+        tree = self._history_tree
+        tree.delete(*tree.get_children())
+        # Populate orders (latest first) in chunks so long histories never
+        # freeze the event loop
         if self.orders:
+            fmt2 = "{:.2f}".format
+            rows = []
             for order in reversed(self.orders):
-                date_time = order.get("date", "").split(" ")
+                date_time = order.date.split(" ")
                 date_part = date_time[0] if len(date_time) > 0 else ""
                 time_part = date_time[1] if len(date_time) > 1 else ""
-                
-                tree.insert("", "end", values=(
+                rows.append(((
                     date_part,
                     time_part,
-                    order.get("name", "").capitalize(),
-                    order.get("quantity", ""),
-                    f"{order.get('amount', 0):.2f}"
-                ))
+                    order.name.capitalize(),
+                    order.quantity,
+                    fmt2(order.amount)
+                ), ()))
+            self._fill_tree_chunked(tree, rows)
         else:
-            tree.insert("", "end", values=("No orders found", "", "", "", ""))
+            # goes through the chunked filler so it also invalidates any
+            # still-pending fill from a previous refresh
+            self._fill_tree_chunked(
+                tree, [(("No orders found", "", "", "", ""), ())]
+            )
 
     def show_admin_panel(self):
         """Show admin panel after authentication"""
         password = simpledialog.askstring("Admin Login", "Enter admin password:", show='*')
-        if password != "admin123":
+        if password is None or not hmac.compare_digest(
+                hashlib.sha256(password.encode()).digest(), ADMIN_PASSWORD_HASH):
             self.show_message("Incorrect password!", "error")
             return
             
         self.clear_content()
         
         content_frame = tk.Frame(self.main_frame, bg='#f8f9fa')
-        content_frame.grid(row=1, column=0, sticky='nsew')
         content_frame.grid_rowconfigure(1, weight=1)
         content_frame.grid_columnconfigure(0, weight=1)
         
@@ -593,7 +1075,7 @@ class VegetableMarket:
         tk.Label(
             content_frame,
             text="⚙️ Admin Panel",
-            font=("Arial", 16, "bold"),
+            font=self._font_title,
             bg='#f8f9fa', fg='#e74c3c'
         ).grid(row=0, column=0, pady=15)
         
@@ -609,7 +1091,7 @@ class VegetableMarket:
         right_frame.pack(side='right', fill='both', expand=True, padx=20, pady=20)
         
         # Left column actions
-        tk.Label(left_frame, text="Inventory Management", font=("Arial", 14, "bold"), bg='white').pack(pady=(0, 15))
+        tk.Label(left_frame, text="Inventory Management", font=self._font_heading, bg='white').pack(pady=(0, 15))
         
         left_actions = [
             ("➕ Add Vegetable", self.add_vegetable, '#28a745'),
@@ -622,12 +1104,12 @@ class VegetableMarket:
             tk.Button(
                 left_frame, text=text, command=command,
                 bg=color, fg='white',
-                font=("Arial", 11), width=20, height=2,
+                font=self._font_body, width=20, height=2,
                 relief='flat', cursor='hand2'
             ).pack(pady=5)
         
         # Right column actions
-        tk.Label(right_frame, text="Reports & Analytics", font=("Arial", 14, "bold"), bg='white').pack(pady=(0, 15))
+        tk.Label(right_frame, text="Reports & Analytics", font=self._font_heading, bg='white').pack(pady=(0, 15))
         
         right_actions = [
             ("📊 View Statistics", self.view_statistics, '#6f42c1'),
@@ -640,10 +1122,12 @@ class VegetableMarket:
             tk.Button(
                 right_frame, text=text, command=command,
                 bg=color, fg='white',
-                font=("Arial", 11), width=20, height=2,
+                font=self._font_body, width=20, height=2,
                 relief='flat', cursor='hand2'
             ).pack(pady=5)
 
+        content_frame.grid(row=1, column=0, sticky='nsew')
+
     def add_vegetable(self):
         """Add new vegetable with enhanced validation"""
         # Create input dialog
@@ -657,7 +1141,7 @@ class VegetableMarket:
         # Center the dialog
         dialog.geometry("+%d+%d" % (self.root.winfo_rootx() + 50, self.root.winfo_rooty() + 50))
         
-        tk.Label(dialog, text="Add New Vegetable", font=("Arial", 14, "bold"), bg='white').pack(pady=10)
+        tk.Label(dialog, text="Add New Vegetable", font=self._font_heading, bg='white').pack(pady=10)
         
         # Name input
         tk.Label(dialog, text="Name:", bg='white').pack()
@@ -707,16 +1191,36 @@ class VegetableMarket:
                    messagebox.showerror("Error", "Cost must be positive!")
                    return
                 
+                self._stock_value += price * stock
                 self.vegetables[name] = {"price": price, "stock": stock,"cost":cost}
-                if self.save_data():
-                    self.show_message(f"'{name.capitalize()}' added successfully!", "success")
-                    dialog.destroy()
+                self._add_name(name)
+                self._schedule_save()
+                self.show_message(f"'{name.capitalize()}' added successfully!", "success")
+                dialog.destroy()
                     
             except ValueError:
                 messagebox.showerror("Error", "Please enter valid numbers for price and stock!")
         
         tk.Button(dialog, text="Add", command=save_vegetable, bg='#28a745', fg='white').pack(pady=10)
 
+    def _build_vegetable_listbox(self, parent, label_for, height=10):
+        """Build the scrollable vegetable list shared by the admin dialogs"""
+        frame = tk.Frame(parent, bg='white')
+        frame.pack(pady=10, padx=20, fill='both', expand=True)
+
+        listbox = tk.Listbox(frame, selectmode='single', height=height)
+        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=listbox.yview)
+        listbox.configure(yscrollcommand=scrollbar.set)
+
+        listbox.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        # one variadic insert = one Tcl round-trip for the whole catalog
+        listbox.insert(tk.END, *[
+            label_for(name, self.vegetables[name]) for name in self._display_names
+        ])
+        return listbox
+
     def remove_vegetable(self):
         """Remove vegetable with confirmation"""
         if not self.vegetables:
@@ -731,22 +1235,12 @@ class VegetableMarket:
         dialog.transient(self.root)
         dialog.grab_set()
         
-        tk.Label(dialog, text="Select vegetable to remove:", font=("Arial", 12, "bold"), bg='white').pack(pady=10)
+        tk.Label(dialog, text="Select vegetable to remove:", font=self._font_label_bold, bg='white').pack(pady=10)
         
-        # Create listbox for selection
-        listbox_frame = tk.Frame(dialog, bg='white')
-        listbox_frame.pack(pady=10, padx=20, fill='both', expand=True)
-        
-        listbox = tk.Listbox(listbox_frame, selectmode='single')
-        scrollbar = ttk.Scrollbar(listbox_frame, orient="vertical", command=listbox.yview)
-        listbox.configure(yscrollcommand=scrollbar.set)
-        
-        listbox.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Populate listbox
-        for name, data in self.vegetables.items():
-            listbox.insert(tk.END, f"{name.capitalize()} (Stock: {data['stock']:.2f}kg, Price: Rs.{data['price']:.2f}/kg)")
+        listbox = self._build_vegetable_listbox(
+            dialog,
+            lambda name, data: f"{self._cap_names[name]} (Stock: {data['stock']:.2f}kg, Price: Rs.{data['price']:.2f}/kg)"
+        )
         
         def confirm_removal():
             selection = listbox.curselection()
@@ -758,10 +1252,12 @@ class VegetableMarket:
             name = selected_item.split(" (")[0].lower()
             
             if messagebox.askyesno("Confirm Removal", f"Are you sure you want to remove '{name.capitalize()}'?"):
-                del self.vegetables[name]
-                if self.save_data():
-                    self.show_message(f"'{name.capitalize()}' removed successfully!", "success")
-                    dialog.destroy()
+                veg = self.vegetables.pop(name)
+                self._stock_value -= veg.get("price", 0) * veg.get("stock", 0)
+                self._remove_name(name)
+                self._schedule_save()
+                self.show_message(f"'{name.capitalize()}' removed successfully!", "success")
+                dialog.destroy()
         
         button_frame = tk.Frame(dialog, bg='white')
         button_frame.pack(pady=10)
@@ -794,26 +1290,16 @@ class VegetableMarket:
         dialog.transient(self.root)
         dialog.grab_set()
         
-        tk.Label(dialog, text=f"{title}", font=("Arial", 14, "bold"), bg='white').pack(pady=10)
-        
-        # Selection frame
-        selection_frame = tk.Frame(dialog, bg='white')
-        selection_frame.pack(pady=10, padx=20, fill='both', expand=True)
-        
-        tk.Label(selection_frame, text="Select vegetable:", bg='white').pack()
+        tk.Label(dialog, text=f"{title}", font=self._font_heading, bg='white').pack(pady=10)
         
-        listbox = tk.Listbox(selection_frame, selectmode='single', height=8)
-        scrollbar = ttk.Scrollbar(selection_frame, orient="vertical", command=listbox.yview)
-        listbox.configure(yscrollcommand=scrollbar.set)
-        
-        listbox.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        tk.Label(dialog, text="Select vegetable:", bg='white').pack(pady=(10, 0))
         
-        # Populate listbox
-        for name, data in self.vegetables.items():
-            current_value = data[field]
-            unit = "kg" if field == "stock" else "Rs/kg"
-            listbox.insert(tk.END, f"{name.capitalize()} (Current: {current_value:.2f} {unit})")
+        value_unit = "kg" if field == "stock" else "Rs/kg"
+        listbox = self._build_vegetable_listbox(
+            dialog,
+            lambda name, data: f"{self._cap_names[name]} (Current: {data[field]:.2f} {value_unit})",
+            height=8
+        )
         
         # Input frame
         input_frame = tk.Frame(dialog, bg='white')
@@ -841,11 +1327,18 @@ class VegetableMarket:
                     messagebox.showerror("Error", "Stock cannot be negative!")
                     return
                 
-                self.vegetables[name][field] = new_value
-                if self.save_data():
-                    unit = "kg" if field == "stock" else "Rs/kg"
-                    self.show_message(f"{field.capitalize()} updated for '{name.capitalize()}' to {new_value:.2f} {unit}!", "success")
-                    dialog.destroy()
+                veg = self.vegetables[name]
+                old_value = veg[field]
+                veg[field] = new_value
+                if field == "price":
+                    self._stock_value += (new_value - old_value) * veg["stock"]
+                else:
+                    self._stock_value += veg["price"] * (new_value - old_value)
+                self._invalidate_veg_label(name)
+                self._schedule_save()
+                unit = "kg" if field == "stock" else "Rs/kg"
+                self.show_message(f"{field.capitalize()} updated for '{name.capitalize()}' to {new_value:.2f} {unit}!", "success")
+                dialog.destroy()
                     
             except ValueError:
                 messagebox.showerror("Error", "Please enter a valid number!")
@@ -858,10 +1351,42 @@ class VegetableMarket:
 
     def view_statistics(self):
         """Display comprehensive business statistics"""
-        self.clear_content()
-        
+        if not self.vegetables and not self.orders:
+            # Common first-run state: nothing to aggregate or render
+            self._show_panel("stats_empty", self._build_empty_stats_panel)
+            return
+        self._show_panel("stats", self._build_stats_panel)
+        self._refresh_stats_panel()
+
+    def _build_empty_stats_panel(self):
+        """Build the placeholder shown while there is no data yet (once)"""
         content_frame = tk.Frame(self.main_frame, bg='#f8f9fa')
+        content_frame.grid_rowconfigure(0, weight=1)
+        content_frame.grid_columnconfigure(0, weight=1)
+        
+        empty_frame = tk.Frame(content_frame, bg='white', relief='raised', bd=2)
+        empty_frame.grid(row=0, column=0, sticky='nsew', padx=20, pady=20)
+        
+        tk.Label(
+            empty_frame,
+            text="📊 Business Statistics & Analytics",
+            font=self._font_title,
+            bg='white', fg='#2c3e50'
+        ).pack(pady=20)
+        
+        tk.Label(
+            empty_frame,
+            text="No data yet — add vegetables and place orders\nto see statistics here.",
+            font=self._font_label,
+            bg='white', fg='#7f8c8d'
+        ).pack(pady=40)
+        
         content_frame.grid(row=1, column=0, sticky='nsew')
+        return content_frame
+
+    def _build_stats_panel(self):
+        """Build the statistics panel (once); values are filled on refresh"""
+        content_frame = tk.Frame(self.main_frame, bg='#f8f9fa')
         content_frame.grid_rowconfigure(0, weight=1)
         content_frame.grid_columnconfigure(0, weight=1)
         
@@ -872,175 +1397,188 @@ class VegetableMarket:
         tk.Label(
             stats_frame,
             text="📊 Business Statistics & Analytics",
-            font=("Arial", 16, "bold"),
+            font=self._font_title,
             bg='white', fg='#2c3e50'
         ).pack(pady=20)
         
-        # Calculate comprehensive statistics
-        total_revenue = sum(order.get("amount", 0) for order in self.orders)
-        total_profit = sum(order.get("profit", 0) for order in self.orders)
-        total_orders = len(self.orders)
-        total_vegetables = len(self.vegetables)
-        total_stock_value = sum(veg["price"] * veg["stock"] for veg in self.vegetables.values())
-        
-        # Average order value
-        avg_order_value = total_revenue / total_orders if total_orders > 0 else 0
-        
-        # Most popular vegetable
-        vegetable_sales = {}
-        for order in self.orders:
-            veg_name = order.get("name", "")
-            vegetable_sales[veg_name] = vegetable_sales.get(veg_name, 0) + 1
-        
-        most_popular = max(vegetable_sales.items(), key=lambda x: x[1]) if vegetable_sales else ("None", 0)
-        
-        # Low stock items
-        low_stock_items = [name for name, data in self.vegetables.items() if data["stock"] < 5]
-        
-        # Create statistics display
         stats_container = tk.Frame(stats_frame, bg='white')
         stats_container.pack(pady=20, padx=40, fill='both', expand=True)
         
-        # Financial Stats
-        financial_frame = tk.LabelFrame(stats_container, text="💰 Financial Overview", font=("Arial", 12, "bold"), bg='white')
-        financial_frame.pack(fill='x', pady=10)
+        self._stats_values = {}
         
-        financial_stats = [
-            ("Total Revenue", f"Rs. {total_revenue:.2f}"),
-            ("Average Order Value", f"Rs. {avg_order_value:.2f}"),
-            ("Current Stock Value", f"Rs. {total_stock_value:.2f}"),
-            ("Total Profit", f"Rs. {total_profit:.2f}")
-
-        ]
+        def build_rows(parent, labels):
+            for label in labels:
+                row_frame = tk.Frame(parent, bg='white')
+                row_frame.pack(fill='x', padx=10, pady=5)
+                tk.Label(row_frame, text=f"{label}:", font=self._font_body, bg='white').pack(side='left')
+                value = tk.Label(row_frame, text="", font=("Arial", 11, "bold"), bg='white', fg='#27ae60')
+                value.pack(side='right')
+                self._stats_values[label] = value
         
-        for i, (label, value) in enumerate(financial_stats):
-            row_frame = tk.Frame(financial_frame, bg='white')
-            row_frame.pack(fill='x', padx=10, pady=5)
-            tk.Label(row_frame, text=f"{label}:", font=("Arial", 11), bg='white').pack(side='left')
-            tk.Label(row_frame, text=value, font=("Arial", 11, "bold"), bg='white', fg='#27ae60').pack(side='right')
+        # Financial Stats
+        financial_frame = tk.LabelFrame(stats_container, text="💰 Financial Overview", font=self._font_label_bold, bg='white')
+        financial_frame.pack(fill='x', pady=10)
+        build_rows(financial_frame, ("Total Revenue", "Average Order Value", "Current Stock Value", "Total Profit"))
         
         # Inventory Stats
-        inventory_frame = tk.LabelFrame(stats_container, text="📦 Inventory Overview", font=("Arial", 12, "bold"), bg='white')
+        inventory_frame = tk.LabelFrame(stats_container, text="📦 Inventory Overview", font=self._font_label_bold, bg='white')
         inventory_frame.pack(fill='x', pady=10)
+        build_rows(inventory_frame, ("Total Vegetables", "Total Orders Placed", "Most Popular Item", "Low Stock Alerts"))
+        for label in ("Total Vegetables", "Total Orders Placed", "Most Popular Item"):
+            self._stats_values[label].config(fg='#3498db')
         
-        inventory_stats = [
-            ("Total Vegetables", str(total_vegetables)),
-            ("Total Orders Placed", str(total_orders)),
-            ("Most Popular Item", f"{most_popular[0].capitalize()} ({most_popular[1]} orders)"),
-            ("Low Stock Alerts", str(len(low_stock_items)))
-        ]
+        # Low stock warning, packed only when the refresh finds alerts
+        self._stats_warning_frame = tk.LabelFrame(stats_container, text="⚠️ Low Stock Alert", font=self._font_label_bold, bg='white', fg='red')
+        self._stats_warning_label = tk.Label(self._stats_warning_frame, text="", font=("Arial", 10), bg='white', fg='red', wraplength=400)
+        self._stats_warning_label.pack(padx=10, pady=5)
         
-        for label, value in inventory_stats:
-            row_frame = tk.Frame(inventory_frame, bg='white')
-            row_frame.pack(fill='x', padx=10, pady=5)
-            tk.Label(row_frame, text=f"{label}:", font=("Arial", 11), bg='white').pack(side='left')
-            color = '#e74c3c' if 'Low Stock' in label and len(low_stock_items) > 0 else '#3498db'
-            tk.Label(row_frame, text=value, font=("Arial", 11, "bold"), bg='white', fg=color).pack(side='right')
+        content_frame.grid(row=1, column=0, sticky='nsew')
+        return content_frame
+
+    def _refresh_stats_panel(self):
+        """Update the statistics labels from the running aggregates"""
+        # Every aggregate here is maintained incrementally as orders are
+        # placed and the catalog changes; opening this page scans nothing
+        # but the low-stock check
+        total_orders = self._total_count
+        avg_order_value = self._total_revenue / total_orders if total_orders > 0 else 0
+        sales = self._sales_counts
+        most_popular = sales.most_common(1)[0] if sales else ("None", 0)
+        low_stock_items = [name for name, data in self.vegetables.items() if data["stock"] < 5]
+        
+        values = self._stats_values
+        _f = "Rs. {:.2f}".format
+        values["Total Revenue"].config(text=_f(self._total_revenue))
+        values["Average Order Value"].config(text=_f(avg_order_value))
+        values["Current Stock Value"].config(text=_f(self._stock_value))
+        values["Total Profit"].config(text=_f(self._total_profit))
+        values["Total Vegetables"].config(text=str(len(self.vegetables)))
+        values["Total Orders Placed"].config(text=str(total_orders))
+        values["Most Popular Item"].config(text=f"{most_popular[0].capitalize()} ({most_popular[1]} orders)")
+        values["Low Stock Alerts"].config(
+            text=str(len(low_stock_items)),
+            fg='#e74c3c' if low_stock_items else '#3498db'
+        )
         
-        # Low stock warning
         if low_stock_items:
-            warning_frame = tk.LabelFrame(stats_container, text="⚠️ Low Stock Alert", font=("Arial", 12, "bold"), bg='white', fg='red')
-            warning_frame.pack(fill='x', pady=10)
-            
-            warning_text = "Low stock items: " + ", ".join([item.capitalize() for item in low_stock_items])
-            tk.Label(warning_frame, text=warning_text, font=("Arial", 10), bg='white', fg='red', wraplength=400).pack(padx=10, pady=5)
-
-    def show_sales_report(self):
-      """Show detailed sales report"""
-      self.clear_content()
-
-      content_frame = tk.Frame(self.main_frame, bg='#f8f9fa')
-      content_frame.grid(row=1, column=0, sticky='nsew')
-      content_frame.grid_rowconfigure(1, weight=1)
-      content_frame.grid_columnconfigure(0, weight=1)
-
-      tk.Label(
-        content_frame,
-        text="📈 Sales Report",
-        font=("Arial", 16, "bold"),
-        bg='#f8f9fa', fg='#2c3e50'
-      ).grid(row=0, column=0, pady=15)
-
-      report_frame = tk.Frame(content_frame, bg='white', relief='raised', bd=1)
-      report_frame.grid(row=1, column=0, sticky='nsew', padx=20, pady=10)
-      report_frame.grid_rowconfigure(0, weight=1)
-      report_frame.grid_columnconfigure(0, weight=1)
-
-    # Calculate sales data
-      vegetable_sales = {}
-      for order in self.orders:
-        veg_name = order.get("name", "")
-        amount = order.get("amount", 0)
-        profit = order.get("profit", 0)
-
-        # Get cost per kg from vegetable database
-        cost_per_kg = self.vegetables.get(veg_name, {}).get("cost", 0)
-
-        # Convert quantity string like "2kg" or "500g" to float in kg
-        quantity_str = order.get("quantity", "0kg").lower()
-        if quantity_str.endswith("kg"):
-            quantity = float(quantity_str.replace("kg", ""))
-        elif quantity_str.endswith("g"):
-            quantity = float(quantity_str.replace("g", "")) / 1000
-        else:
-            quantity = 0
-
-        if veg_name in vegetable_sales:
-            vegetable_sales[veg_name]["orders"] += 1
-            vegetable_sales[veg_name]["quantity"] += quantity
-            vegetable_sales[veg_name]["revenue"] += amount
-            vegetable_sales[veg_name]["profit"] += profit
+            warning_text = "Low stock items: " + ", ".join(self._cap_names[item] for item in low_stock_items)
+            self._stats_warning_label.config(text=warning_text)
+            self._stats_warning_frame.pack(fill='x', pady=10)
         else:
-            vegetable_sales[veg_name] = {
-                "orders": 1,
-                "quantity": quantity,
-                "revenue": amount,
-                "profit": profit,
-                "cost": cost_per_kg
-            }
+            self._stats_warning_frame.pack_forget()
 
-    # Create treeview for sales report
-      columns = ("Vegetable", "Cost (Rs/kg)", "Quantity (kg)", "Profit (Rs)", "revenue","avg_revenue")
-      tree = ttk.Treeview(report_frame, columns=columns, show="headings", height=15)
-
-      for col in columns:
-        tree.heading(col, text=col)
-        tree.column(col, width=150, anchor="center")
-
-      scrollbar = ttk.Scrollbar(report_frame, orient="vertical", command=tree.yview)
-      tree.configure(yscrollcommand=scrollbar.set)
+    def show_sales_report(self):
+        """Show detailed sales report"""
+        self._show_panel("sales", self._build_sales_panel)
+        self._refresh_sales_panel()
 
-      tree.grid(row=0, column=0, sticky='nsew')
-      scrollbar.grid(row=0, column=1, sticky='ns')
+    def _build_sales_panel(self):
+        """Build the sales report panel (once); rows are filled on refresh"""
+        content_frame = tk.Frame(self.main_frame, bg='#f8f9fa')
+        content_frame.grid_rowconfigure(1, weight=1)
+        content_frame.grid_columnconfigure(0, weight=1)
+        
+        tk.Label(
+            content_frame,
+            text="📈 Sales Report",
+            font=self._font_title,
+            bg='#f8f9fa', fg='#2c3e50'
+        ).grid(row=0, column=0, pady=15)
+        
+        report_frame = tk.Frame(content_frame, bg='white', relief='raised', bd=1)
+        report_frame.grid(row=1, column=0, sticky='nsew', padx=20, pady=10)
+        report_frame.grid_rowconfigure(0, weight=1)
+        report_frame.grid_columnconfigure(0, weight=1)
+        
+        columns = ("Vegetable", "Cost (Rs/kg)", "Quantity (kg)", "Profit (Rs)", "revenue", "avg_revenue")
+        tree = ttk.Treeview(report_frame, columns=columns, show="headings", height=15)
+        
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=150, anchor="center")
+        
+        scrollbar = ttk.Scrollbar(report_frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        
+        tree.grid(row=0, column=0, sticky='nsew')
+        scrollbar.grid(row=0, column=1, sticky='ns')
+        self._sales_tree = tree
+        
+        content_frame.grid(row=1, column=0, sticky='nsew')
+        return content_frame
 
-    # Populate data
-      if vegetable_sales:
-         for veg_name, data in sorted(vegetable_sales.items(), key=lambda x: x[1]["revenue"], reverse=True):
-            avg_value = data["revenue"] / data["orders"] if data["orders"] > 0 else 0
-            tree.insert("", "end", values=(
+    def _refresh_sales_panel(self):
+        """Recompute the per-vegetable sales summary and refill the table"""
+        tree = self._sales_tree
+        tree.delete(*tree.get_children())
+        
+        # Calculate sales data; build the cost lookup once instead of probing
+        # the nested catalog dicts for every order
+        cost_map = {name: veg.get("cost", 0) for name, veg in self.vegetables.items()}
+        vegetable_sales = {}
+        for order in self.orders:
+            veg_name = order.name
+            amount = order.amount
+            profit = order.profit
+            quantity = order.quantity_kg
+            
+            if veg_name in vegetable_sales:
+                vegetable_sales[veg_name]["orders"] += 1
+                vegetable_sales[veg_name]["quantity"] += quantity
+                vegetable_sales[veg_name]["revenue"] += amount
+                vegetable_sales[veg_name]["profit"] += profit
+            else:
+                vegetable_sales[veg_name] = {
+                    "orders": 1,
+                    "quantity": quantity,
+                    "revenue": amount,
+                    "profit": profit,
+                    "cost": cost_map.get(veg_name, 0)
+                }
+        
+        if vegetable_sales:
+            fmt2 = "{:.2f}".format
+            rows = [(
                 veg_name.capitalize(),
-                f"{data['cost']:.2f}",
-                f"{data['quantity']:.2f}",
-                f"{data['profit']:.2f}",
-                f"{data['revenue']:.2f}",
-                f"{avg_value:.2f}"
-            ))
-      else:
-        tree.insert("", "end", values=("No sales data available", "", "", "", ""))
-
+                fmt2(data['cost']),
+                fmt2(data['quantity']),
+                fmt2(data['profit']),
+                fmt2(data['revenue']),
+                fmt2(data['revenue'] / data['orders'] if data['orders'] > 0 else 0)
+            ) for veg_name, data in sorted(
+                vegetable_sales.items(), key=lambda x: x[1]["revenue"], reverse=True
+            )]
+            # Hide the columns during the bulk insert so Tk skips per-row
+            # width recalculation and redraws, then show them again
+            tree.configure(displaycolumns=())
+            for row in rows:
+                tree.insert("", "end", values=row)
+            tree.configure(displaycolumns="#all")
+        else:
+            tree.insert("", "end", values=("No sales data available", "", "", "", ""))
 
     def backup_data(self):
         """Create a backup of the data"""
         try:
-            backup_filename = f"vegetable_market_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            # only user of datetime; imported here to keep startup lean
+            from datetime import datetime
+            now = datetime.now()
+            backup_filename = f"vegetable_market_backup_{now.strftime('%Y%m%d_%H%M%S')}.json"
             data = {
                 "vegetables": self.vegetables,
                 "orders": self.orders,
-                "backup_date": datetime.now().isoformat()
+                "backup_date": now.isoformat()
             }
             
-            with open(backup_filename, "w") as file:
-                json.dump(data, file, indent=4)
+            # Backups are for restoring, not reading: write compact bytes
+            # through a large buffer instead of a pretty-printed text stream
+            with open(backup_filename, "wb", buffering=1 << 20) as file:
+                if orjson is not None:
+                    file.write(orjson.dumps(data))
+                else:
+                    file.write(json.dumps(
+                        data, separators=(",", ":"), default=asdict
+                    ).encode())
             
             self.show_message(f"Data backed up successfully to {backup_filename}", "success")
         except Exception as e:
@@ -1055,9 +1593,11 @@ class VegetableMarket:
                                   "This action cannot be undone!\n\nProceed with clearing all data?"):
                 self.vegetables = {}
                 self.orders = []
-                if self.save_data():
-                    self.show_message("All data cleared successfully!", "success")
-                    self.show_main_menu()  # Return to main menu
+                self._rebuild_name_caches()
+                self._save_q.put(("clear_orders", b""))
+                self._schedule_save()
+                self.show_message("All data cleared successfully!", "success")
+                self.show_main_menu()  # Return to main menu
 
     def show_message(self, message, msg_type="info"):
         """Show message with appropriate styling"""
@@ -1070,13 +1610,19 @@ class VegetableMarket:
 
     def sort_treeview(self, tree, col):
         """Sort treeview by column"""
-        data = [(tree.set(child, col), child) for child in tree.get_children('')]
-        
-        # Try to sort numerically if possible
+        children = tree.get_children('')
+        shadow = self._tree_numeric.get(tree)
         try:
-            data.sort(key=lambda x: float(x[0].replace('Rs. ', '').replace('kg', '').strip()))
-        except (ValueError, AttributeError):
+            # Sort on the recorded floats; no per-row string munging
+            data = [(shadow[child][col], child) for child in children]
             data.sort()
+        except (KeyError, TypeError):
+            data = [(tree.set(child, col), child) for child in children]
+            # Try to sort numerically if possible
+            try:
+                data.sort(key=lambda x: float(x[0].replace('Rs. ', '').replace('kg', '').strip()))
+            except (ValueError, AttributeError):
+                data.sort()
         
         for index, (val, child) in enumerate(data):
             tree.move(child, '', index)
@@ -1084,7 +1630,7 @@ class VegetableMarket:
     def confirm_exit(self):
         """Confirm before exiting"""
         if messagebox.askyesno("Exit Application", "Are you sure you want to exit?"):
-            self.root.quit()
+            self._on_close()
 
     def run(self):
         """Start the application"""